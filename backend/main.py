@@ -1,12 +1,72 @@
 # main.py
-from fastapi import FastAPI
+import json
+import os
+import sys
+from typing import Optional
 
-app = FastAPI()
+from fastapi import FastAPI, Response
+from pydantic import BaseModel
+
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+# The OpenAPI schema (and the /docs UI built on it) is only generated in debug mode.
+app = FastAPI(openapi_url="/openapi.json" if DEBUG else None)
+
+# The root payload never changes, so serialize it once instead of per request.
+_ROOT_BODY = json.dumps({"message": "Hello World"}, separators=(",", ":")).encode()
+
+class ItemResponse(BaseModel):
+    item_id: int
+    q: Optional[str] = None
 
 @app.get("/")
-def read_root():
-    return {"message": "Hello World"}
+async def read_root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
-@app.get("/items/{item_id}")
-def read_item(item_id: int, q: str = None):
+@app.get("/items/{item_id}", response_model=ItemResponse)
+async def read_item(item_id: int, q: str = None):
     return {"item_id": item_id, "q": q}
+
+if __name__ == "__main__":
+    import server_config
+
+    host = os.getenv("HOST", "0.0.0.0")
+    port = int(os.getenv("PORT", "8000"))
+
+    # Gunicorn does not run on Windows, so it always gets the single-process server.
+    if DEBUG or sys.platform == "win32":
+        import uvicorn
+
+        uvicorn.run(
+            "main:app",
+            host=host,
+            port=port,
+            reload=DEBUG,
+            loop=server_config.LOOP,
+            http=server_config.HTTP,
+            timeout_keep_alive=server_config.KEEP_ALIVE,
+            limit_concurrency=server_config.LIMIT_CONCURRENCY,
+            backlog=server_config.BACKLOG,
+        )
+    else:
+        workers = os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))
+        # Run gunicorn under this interpreter so it sees the same installed requirements,
+        # even when the virtualenv's bin directory is not on PATH.
+        os.execv(
+            sys.executable,
+            [
+                sys.executable,
+                "-m", "gunicorn",
+                "main:app",
+                "-k", "workers.GuardianWorker",
+                "-w", workers,
+                "-b", f"{host}:{port}",
+                "--keep-alive", str(server_config.KEEP_ALIVE),
+                # Import the app once in the master so workers share its pages copy-on-write.
+                "--preload",
+                "--backlog", str(server_config.BACKLOG),
+                # Recycle workers periodically to bound memory growth; jitter staggers restarts.
+                "--max-requests", str(server_config.MAX_REQUESTS),
+                "--max-requests-jitter", str(server_config.MAX_REQUESTS_JITTER),
+            ],
+        )
@@ -0,0 +1,14 @@
+# server_config.py
+"""Server settings shared by the launcher in main.py and the Gunicorn worker in workers.py."""
+import os
+import sys
+
+# uvloop is not available on Windows; let uvicorn pick the asyncio loop there.
+LOOP = "auto" if sys.platform == "win32" else "uvloop"
+HTTP = "httptools"
+KEEP_ALIVE = 30
+LIMIT_CONCURRENCY = int(os.getenv("LIMIT_CONCURRENCY", "1000"))
+BACKLOG = int(os.getenv("BACKLOG", "2048"))
+MAX_REQUESTS = int(os.getenv("MAX_REQUESTS", "10000"))
+# Default to 10% of MAX_REQUESTS so the restart spread scales with the configured value.
+MAX_REQUESTS_JITTER = int(os.getenv("MAX_REQUESTS_JITTER", str(MAX_REQUESTS // 10)))
@@ -0,0 +1,14 @@
+# workers.py
+from uvicorn_worker import UvicornWorker
+
+import server_config
+
+
+class GuardianWorker(UvicornWorker):
+    """Gunicorn worker that runs uvicorn with the loop, parser and limits from server_config."""
+
+    CONFIG_KWARGS = {
+        "loop": server_config.LOOP,
+        "http": server_config.HTTP,
+        "limit_concurrency": server_config.LIMIT_CONCURRENCY,
+    }